@@ -1,7 +1,6 @@
+import sys
 import warnings
-from collections import ChainMap
 from functools import wraps
-from itertools import chain
 from types import FunctionType
 from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, Union, overload
 
@@ -14,7 +13,7 @@ if TYPE_CHECKING:
 
 
 class Validator:
-    __slots__ = 'func', 'pre', 'each_item', 'always', 'check_fields', 'skip_on_failure'
+    __slots__ = 'func', 'func_name', 'pre', 'each_item', 'always', 'check_fields', 'skip_on_failure'
 
     def __init__(
         self,
@@ -26,6 +25,9 @@ class Validator:
         skip_on_failure: bool = False,
     ):
         self.func = func
+        # cached here so it's computed once at registration rather than on every lookup;
+        # `__get_validators__` may yield callables without a `__name__` (e.g. partials), hence the fallback
+        self.func_name = getattr(func, '__name__', repr(func))
         self.pre = pre
         self.each_item = each_item
         self.always = always
@@ -155,29 +157,47 @@ def _prepare_validator(function: AnyCallable, allow_reuse: bool) -> 'AnyClassMet
 
 
 class ValidatorGroup:
+    __slots__ = 'validators', 'used_validators', '_all_fields_validators', '_merged_validators'
+
     def __init__(self, validators: 'ValidatorListDict') -> None:
         self.validators = validators
-        self.used_validators = {'*'}
+        # pre-sized flag dict over the registered names; marking a name used is then a plain store
+        # with no hash-table growth for known fields
+        self.used_validators: Dict[str, bool] = dict.fromkeys(validators, False)
+        self.used_validators['*'] = True
+        # validators are fully collected by the time the group is created, so the merge of field-specific
+        # and "all fields" validators can be computed once here instead of on every `get_validators` call
+        all_fields_validators = tuple(validators.get('*', ()))
+        self._all_fields_validators = all_fields_validators
+        self._merged_validators: Dict[str, Tuple[Validator, ...]] = {
+            name: tuple(field_validators) if name == ROOT_KEY else tuple(field_validators) + all_fields_validators
+            for name, field_validators in validators.items()
+        }
 
     def get_validators(self, name: str) -> Optional[Dict[str, Validator]]:
-        self.used_validators.add(name)
-        validators = self.validators.get(name, [])
-        if name != ROOT_KEY:
-            validators += self.validators.get('*', [])
+        if not self.validators:
+            # common case: the model defines no class validators at all, nothing to merge or track
+            return None
+        self.used_validators[name] = True
+        validators = self._merged_validators.get(name)
+        if validators is None and name != ROOT_KEY:
+            validators = self._all_fields_validators
         if validators:
-            return {v.func.__name__: v for v in validators}
+            return {v.func_name: v for v in validators}
         else:
             return None
 
     def check_for_unused(self) -> None:
-        unused_validators = set(
-            chain.from_iterable(
-                (v.func.__name__ for v in self.validators[f] if v.check_fields)
-                for f in (self.validators.keys() - self.used_validators)
-            )
-        )
+        used_validators = self.used_validators
+        unused_validators = [
+            v.func_name
+            for field, validators in self.validators.items()
+            if not used_validators[field]
+            for v in validators
+            if v.check_fields
+        ]
         if unused_validators:
-            fn = ', '.join(unused_validators)
+            fn = ', '.join(set(unused_validators))
             raise ConfigError(
                 f"Validators defined with incorrect fields: {fn} "  # noqa: Q000
                 f"(use check_fields=False if you're inheriting from the model and intended this)"
@@ -191,43 +211,72 @@ def extract_validators(namespace: Dict[str, Any]) -> Dict[str, List[Validator]]:
         if validator_config:
             fields, v = validator_config
             for field in fields:
-                if field in validators:
-                    validators[field].append(v)
-                else:
-                    validators[field] = [v]
+                validators.setdefault(sys.intern(field), []).append(v)
     return validators
 
 
 def extract_root_validators(namespace: Dict[str, Any]) -> Tuple[List[AnyCallable], List[Tuple[bool, AnyCallable]]]:
-    from inspect import signature
-
     pre_validators: List[AnyCallable] = []
     post_validators: List[Tuple[bool, AnyCallable]] = []
     for name, value in namespace.items():
         validator_config: Optional[Validator] = getattr(value, ROOT_VALIDATOR_CONFIG_KEY, None)
         if validator_config:
-            sig = signature(validator_config.func)
-            args = list(sig.parameters.keys())
-            if args[0] == 'self':
-                raise ConfigError(
-                    f'Invalid signature for root validator {name}: {sig}, "self" not permitted as first argument, '
-                    f'should be: (cls, values).'
-                )
-            if len(args) != 2:
-                raise ConfigError(f'Invalid signature for root validator {name}: {sig}, should be: (cls, values).')
-            # check function signature
-            if validator_config.pre:
-                pre_validators.append(validator_config.func)
-            else:
-                post_validators.append((validator_config.skip_on_failure, validator_config.func))
+            _add_root_validator(name, validator_config, pre_validators, post_validators)
     return pre_validators, post_validators
 
 
+def extract_all_validators(
+    namespace: Dict[str, Any]
+) -> Tuple['ValidatorListDict', List[AnyCallable], List[Tuple[bool, AnyCallable]]]:
+    """
+    Collect both field and root validators in a single pass over the namespace; a method carries at
+    most one of the two config tags, so the root tag is only looked up when the field tag is absent.
+    """
+    validators: Dict[str, List[Validator]] = {}
+    pre_validators: List[AnyCallable] = []
+    post_validators: List[Tuple[bool, AnyCallable]] = []
+    for name, value in namespace.items():
+        validator_config = getattr(value, VALIDATOR_CONFIG_KEY, None)
+        if validator_config is not None:
+            fields, v = validator_config
+            for field in fields:
+                # field names used as dict keys match model attribute names, which CPython interns;
+                # interning here too makes the later lookups hit the pointer-equality fast path
+                validators.setdefault(sys.intern(field), []).append(v)
+            continue
+        root_validator_config: Optional[Validator] = getattr(value, ROOT_VALIDATOR_CONFIG_KEY, None)
+        if root_validator_config is not None:
+            _add_root_validator(name, root_validator_config, pre_validators, post_validators)
+    return validators, pre_validators, post_validators
+
+
+def _add_root_validator(
+    name: str,
+    validator_config: Validator,
+    pre_validators: List[AnyCallable],
+    post_validators: List[Tuple[bool, AnyCallable]],
+) -> None:
+    from inspect import signature
+
+    # check function signature
+    sig = signature(validator_config.func)
+    args = list(sig.parameters.keys())
+    if args[0] == 'self':
+        raise ConfigError(
+            f'Invalid signature for root validator {name}: {sig}, "self" not permitted as first argument, '
+            f'should be: (cls, values).'
+        )
+    if len(args) != 2:
+        raise ConfigError(f'Invalid signature for root validator {name}: {sig}, should be: (cls, values).')
+    if validator_config.pre:
+        pre_validators.append(validator_config.func)
+    else:
+        post_validators.append((validator_config.skip_on_failure, validator_config.func))
+
+
 def inherit_validators(base_validators: 'ValidatorListDict', validators: 'ValidatorListDict') -> 'ValidatorListDict':
     for field, field_validators in base_validators.items():
-        if field not in validators:
-            validators[field] = []
-        validators[field] += field_validators
+        validators.setdefault(field, []).extend(field_validators)
     return validators
 
 
@@ -263,6 +312,23 @@ def prep_validators(v_funcs: Iterable[AnyCallable]) -> 'ValidatorsList':
     return [make_generic_validator(f) for f in v_funcs if f]
 
 
+def make_fused_validator(validators: 'ValidatorsList') -> 'ValidatorCallable':
+    """
+    Compile a sequence of prepared validators into a single validator which applies them in order.
+
+    The validator lists on a field are fixed once `populate_validators` has run, so the chain of
+    calls can be generated and compiled once per field; each validator is bound as a default
+    argument (a local variable lookup) and per-value validation no longer pays for a Python-level
+    loop over the list.
+    """
+    params = ''.join(f', _v_{i}=_validators[{i}]' for i in range(len(validators)))
+    body = '\n'.join(f'    v = _v_{i}(cls, v, values, field, config)' for i in range(len(validators)))
+    source = f'def fused_validator(cls, v, values, field, config{params}):\n{body}\n    return v\n'
+    namespace: Dict[str, Any] = {'_validators': validators}
+    exec(source, namespace)
+    return namespace['fused_validator']
+
+
 all_kwargs = {'values', 'field', 'config'}
 
 
@@ -334,6 +400,8 @@ def _generic_validator_basic(validator: AnyCallable, sig: 'Signature', args: Set
 
 
 def gather_all_validators(type_: 'ModelOrDc') -> Dict[str, 'AnyClassMethod']:
+    from collections import ChainMap
+
     all_attributes = ChainMap(*[cls.__dict__ for cls in type_.__mro__])  # type: ignore[arg-type,var-annotated]
     return {
         k: v
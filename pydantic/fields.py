@@ -29,7 +29,7 @@ from typing import (
 from typing_extensions import Annotated, Final
 
 from . import errors as errors_
-from .class_validators import Validator, make_generic_validator, prep_validators
+from .class_validators import Validator, make_fused_validator, make_generic_validator, prep_validators
 from .error_wrappers import ErrorWrapper
 from .errors import ConfigError, InvalidDiscriminator, MissingDiscriminator, NoneIsNotAllowedError
 from .types import Json, JsonWrapper
@@ -832,6 +832,8 @@ class ModelField(Representation):
                 *[v.func for v in class_validators_ if v.each_item and not v.pre],
             )
             self.validators = prep_validators(v_funcs)
+            if len(self.validators) > 1:
+                self.validators = [make_fused_validator(self.validators)]
 
         self.pre_validators = []
         self.post_validators = []
@@ -846,6 +848,10 @@ class ModelField(Representation):
         if self.parse_json:
             self.pre_validators.append(make_generic_validator(validate_json))
 
+        if len(self.pre_validators) > 1:
+            self.pre_validators = [make_fused_validator(self.pre_validators)]
+        if len(self.post_validators) > 1:
+            self.post_validators = [make_fused_validator(self.post_validators)]
         self.pre_validators = self.pre_validators or None
         self.post_validators = self.post_validators or None
 
@@ -19,19 +19,19 @@ from typing import (
     Type,
     TypeVar,
     Union,
-    cast,
     no_type_check,
     overload,
 )
 
 from typing_extensions import dataclass_transform
 
-from .class_validators import ValidatorGroup, extract_root_validators, extract_validators, inherit_validators
+from .class_validators import ValidatorGroup, extract_all_validators, inherit_validators
 from .config import BaseConfig, Extra, inherit_config, prepare_config
 from .error_wrappers import ErrorWrapper, ValidationError
 from .errors import ConfigError, DictError, ExtraError, MissingError
 from .fields import (
     MAPPING_LIKE_SHAPES,
+    SHAPE_SINGLETON,
     Field,
     FieldInfo,
     ModelField,
@@ -56,9 +56,11 @@ from .typing import (
 )
 from .utils import (
     DUNDER_ATTRIBUTES,
+    IMMUTABLE_NON_COLLECTIONS_TYPES,
     ROOT_KEY,
     ClassAttribute,
     GetterDict,
+    LimitedDict,
     Representation,
     ValueItems,
     generate_model_signature,
@@ -116,6 +118,9 @@ UNTOUCHED_TYPES: Tuple[Any, ...] = (FunctionType,) + ANNOTATED_FIELD_UNTOUCHED_T
 # safe to refer to it. If it *hasn't* been created, we assume that the `__new__` call we're in the middle of is for
 # the `BaseModel` class, since that's defined immediately after the metaclass.
 _is_base_model_class_defined = False
+# plain leaf values `_get_value` returns unchanged; looked up by exact type to skip the isinstance ladder
+_SIMPLE_VALUE_TYPES = {str, int, float, bool, bytes, type(None)}
+_SIMPLE_CONTAINER_TYPES = {list, tuple, set, frozenset}
 
 
 @dataclass_transform(kw_only_default=True, field_specifiers=(Field, FieldInfo))
@@ -157,7 +162,8 @@ class ModelMetaclass(ABCMeta):
             raise TypeError('Specifying config in two places is ambiguous, use either Config attribute or class kwargs')
         config = inherit_config(config_from_namespace, config, **config_kwargs)
 
-        validators = inherit_validators(extract_validators(namespace), validators)
+        namespace_validators, pre_rv_new, post_rv_new = extract_all_validators(namespace)
+        validators = inherit_validators(namespace_validators, validators)
         vg = ValidatorGroup(validators)
 
         for f in fields.values():
@@ -240,15 +246,60 @@ class ModelMetaclass(ABCMeta):
         if _custom_root_type:
             validate_custom_root_type(fields)
         vg.check_for_unused()
+        # whether dict()/json() can short-circuit to a plain copy of __dict__: only when every value is
+        # guaranteed to be a simple leaf and no field-level or extra values can sneak nested data in;
+        # fields with class validators and models with root validators don't qualify since a validator
+        # may store any runtime type, and unvalidated assignment can do the same under mutable configs
+        _simple_dict = (
+            not _custom_root_type
+            and config.extra is not Extra.allow
+            and not (pre_root_validators or post_root_validators or pre_rv_new or post_rv_new)
+            and (config.validate_assignment or not config.allow_mutation or config.frozen)
+            and all(
+                f.shape == SHAPE_SINGLETON
+                and not f.sub_fields
+                and f.type_ in _SIMPLE_VALUE_TYPES
+                and not f.class_validators
+                and f.field_info.exclude is None
+                and f.field_info.include is None
+                for f in fields.values()
+            )
+        )
         if config.json_encoders:
             json_encoder = partial(custom_pydantic_encoder, config.json_encoders)
         else:
             json_encoder = pydantic_encoder
-        pre_rv_new, post_rv_new = extract_root_validators(namespace)
-
         if hash_func is None:
             hash_func = generate_hash_function(config.frozen)
 
+        # only fields whose alias actually differs need translating when serializing with by_alias
+        _alias_map = {field_name: field.alias for field_name, field in fields.items() if field.alias != field_name}
+        # (name, alias or None) pairs consumed by `construct`, so it doesn't re-read the
+        # alt_alias/alias attributes of every field on every call; `required` stays dynamic
+        # since it can be resolved later by update_forward_refs
+        _construct_fields = tuple(
+            (field_name, field.alias if field.alt_alias else None, field) for field_name, field in fields.items()
+        )
+
+        # resolve copy_on_model_validation once: None means no copy, otherwise the deep flag;
+        # legacy boolean values keep warning per validation, so only the mode is precomputed
+        copy_on_model_validation = config.copy_on_model_validation
+        _copy_on_model_validation_legacy = copy_on_model_validation not in ('deep', 'shallow', 'none')
+        if copy_on_model_validation == 'deep':
+            _copy_on_model_validation_deep: Optional[bool] = True
+        elif copy_on_model_validation == 'shallow' or (_copy_on_model_validation_legacy and copy_on_model_validation):
+            _copy_on_model_validation_deep = False
+        else:
+            _copy_on_model_validation_deep = None
+
+        _private_attributes = {**base_private_attributes, **private_attributes}
+        # only these need visiting on every instance creation; attrs without a default stay unset
+        _private_attributes_with_default = tuple(
+            (k, v)
+            for k, v in _private_attributes.items()
+            if v.default is not Undefined or v.default_factory is not None
+        )
+
         exclude_from_namespace = fields | private_attributes.keys() | {'__slots__'}
         new_namespace = {
             '__config__': config,
@@ -273,7 +324,14 @@ class ModelMetaclass(ABCMeta):
             '__schema_cache__': {},
             '__json_encoder__': staticmethod(json_encoder),
             '__custom_root_type__': _custom_root_type,
-            '__private_attributes__': {**base_private_attributes, **private_attributes},
+            '__root_field_is_mapping__': _custom_root_type and fields[ROOT_KEY].shape in MAPPING_LIKE_SHAPES,
+            '__copy_on_model_validation_deep__': _copy_on_model_validation_deep,
+            '__copy_on_model_validation_legacy__': _copy_on_model_validation_legacy,
+            '__simple_dict__': _simple_dict,
+            '__alias_map__': _alias_map,
+            '__construct_fields__': _construct_fields,
+            '__private_attributes__': _private_attributes,
+            '__private_attributes_with_default__': _private_attributes_with_default,
             '__slots__': slots | private_attributes.keys(),
             '__hash__': hash_func,
             '__class_vars__': class_vars,
@@ -302,7 +360,10 @@ class ModelMetaclass(ABCMeta):
 
         See #3829 and python/cpython#92810
         """
-        return hasattr(instance, '__fields__') and super().__instancecheck__(instance)
+        # every class built by this metaclass gets '__fields__' in its own namespace, so probing the
+        # class __dict__ is enough and, unlike hasattr, raises no AttributeError for non-models;
+        # `instance.__class__` (not type()) keeps __class__-spoofing objects such as mocks working
+        return '__fields__' in instance.__class__.__dict__ and super().__instancecheck__(instance)
 
 
 object_setattr = object.__setattr__
@@ -321,8 +382,15 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
         __json_encoder__: ClassVar[Callable[[Any], Any]] = lambda x: x
         __schema_cache__: ClassVar['DictAny'] = {}
         __custom_root_type__: ClassVar[bool] = False
+        __root_field_is_mapping__: ClassVar[bool] = False
+        __copy_on_model_validation_deep__: ClassVar[Optional[bool]] = None
+        __copy_on_model_validation_legacy__: ClassVar[bool] = False
+        __simple_dict__: ClassVar[bool] = False
+        __alias_map__: ClassVar[Dict[str, str]] = {}
+        __construct_fields__: ClassVar[Tuple[Tuple[str, Optional[str], ModelField], ...]] = ()
         __signature__: ClassVar['Signature']
         __private_attributes__: ClassVar[Dict[str, ModelPrivateAttr]]
+        __private_attributes_with_default__: ClassVar[Tuple[Tuple[str, ModelPrivateAttr], ...]]
         __class_vars__: ClassVar[SetStr]
         __fields_set__: ClassVar[SetStr] = set()
 
@@ -354,16 +422,19 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
         if name in self.__private_attributes__ or name in DUNDER_ATTRIBUTES:
             return object_setattr(self, name, value)
 
-        if self.__config__.extra is not Extra.allow and name not in self.__fields__:
+        config = self.__config__
+        known_field = self.__fields__.get(name)
+        if config.extra is not Extra.allow and known_field is None:
             raise ValueError(f'"{self.__class__.__name__}" object has no field "{name}"')
-        elif not self.__config__.allow_mutation or self.__config__.frozen:
+        elif not config.allow_mutation or config.frozen:
             raise TypeError(f'"{self.__class__.__name__}" is immutable and does not support item assignment')
-        elif name in self.__fields__ and self.__fields__[name].final:
+        elif known_field is not None and known_field.final:
             raise TypeError(
                 f'"{self.__class__.__name__}" object "{name}" field is final and does not support reassignment'
             )
-        elif self.__config__.validate_assignment:
-            new_values = {**self.__dict__, name: value}
+        elif config.validate_assignment:
+            new_values = self.__dict__.copy()
+            new_values[name] = value
 
             for validator in self.__pre_root_validators__:
                 try:
@@ -371,7 +442,6 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
                 except (ValueError, TypeError, AssertionError) as exc:
                     raise ValidationError([ErrorWrapper(exc, loc=ROOT_KEY)], self.__class__)
 
-            known_field = self.__fields__.get(name, None)
             if known_field:
                 # We want to
                 # - make sure validators are called without the current value for this field inside `values`
@@ -379,7 +449,8 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
                 # - keep the order of the fields
                 if not known_field.field_info.allow_mutation:
                     raise TypeError(f'"{known_field.name}" has allow_mutation set to False and cannot be assigned')
-                dict_without_original_value = {k: v for k, v in self.__dict__.items() if k != name}
+                dict_without_original_value = self.__dict__.copy()
+                dict_without_original_value.pop(name, None)
                 value, error_ = known_field.validate(value, dict_without_original_value, loc=name, cls=self.__class__)
                 if error_:
                     raise ValidationError([error_], self.__class__)
@@ -406,11 +477,16 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
         self.__fields_set__.add(name)
 
     def __getstate__(self) -> 'DictAny':
-        private_attrs = ((k, getattr(self, k, Undefined)) for k in self.__private_attributes__)
+        private_attribute_values: 'DictAny' = {}
+        if self.__private_attributes__:
+            for k in self.__private_attributes__:
+                v = getattr(self, k, Undefined)
+                if v is not Undefined:
+                    private_attribute_values[k] = v
         return {
             '__dict__': self.__dict__,
             '__fields_set__': self.__fields_set__,
-            '__private_attribute_values__': {k: v for k, v in private_attrs if v is not Undefined},
+            '__private_attribute_values__': private_attribute_values,
         }
 
     def __setstate__(self, state: 'DictAny') -> None:
@@ -420,7 +496,7 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
             object_setattr(self, name, value)
 
     def _init_private_attributes(self) -> None:
-        for name, private_attr in self.__private_attributes__.items():
+        for name, private_attr in self.__private_attributes_with_default__:
             default = private_attr.get_default()
             if default is not Undefined:
                 object_setattr(self, name, default)
@@ -447,6 +523,14 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
             )
             exclude_unset = skip_defaults
 
+        if (
+            self.__simple_dict__
+            and include is None
+            and exclude is None
+            and not (by_alias or exclude_unset or exclude_defaults or exclude_none)
+        ):
+            return dict(self.__dict__)
+
         return dict(
             self._iter(
                 to_dict=True,
@@ -484,7 +568,19 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
                 DeprecationWarning,
             )
             exclude_unset = skip_defaults
-        encoder = cast(Callable[[Any], Any], encoder or self.__json_encoder__)
+        if encoder is None:
+            # mypy wrongly binds the ClassVar callable as a method here; cast() would fix that
+            # at the cost of a runtime call, which is what this fast path avoids
+            encoder = self.__json_encoder__  # type: ignore[assignment]
+
+        if (
+            self.__simple_dict__
+            and include is None
+            and exclude is None
+            and not (by_alias or exclude_unset or exclude_defaults or exclude_none)
+        ):
+            # json_dumps is user-pluggable, so hand it a copy rather than the live __dict__
+            return self.__config__.json_dumps(dict(self.__dict__), default=encoder, **dumps_kwargs)
 
         # We don't directly call `self.dict()`, which does exactly this with `to_dict=True`
         # because we want to be able to keep raw `BaseModel` instances and not as `dict`.
@@ -507,8 +603,7 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
     @classmethod
     def _enforce_dict_if_root(cls, obj: Any) -> Any:
         if cls.__custom_root_type__ and (
-            not (isinstance(obj, dict) and obj.keys() == {ROOT_KEY})
-            or cls.__fields__[ROOT_KEY].shape in MAPPING_LIKE_SHAPES
+            cls.__root_field_is_mapping__ or not (isinstance(obj, dict) and obj.keys() == {ROOT_KEY})
         ):
             return {ROOT_KEY: obj}
         else:
@@ -523,7 +618,25 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
             except (TypeError, ValueError) as e:
                 exc = TypeError(f'{cls.__name__} expected dict not {obj.__class__.__name__}')
                 raise ValidationError([ErrorWrapper(exc, loc=ROOT_KEY)], cls) from e
-        return cls(**obj)
+        if cls.__init__ is not BaseModel.__init__:
+            # a custom __init__ must keep receiving the data as keyword arguments
+            return cls(**obj)
+        # otherwise validate the parsed dict directly, saving the **obj keyword repack;
+        # validate against a copy so root validators mutating their input in place
+        # cannot rewrite the caller's dict
+        m = cls.__new__(cls)
+        values, fields_set, validation_error = validate_model(cls, dict(obj))
+        if validation_error:
+            raise validation_error
+        try:
+            object_setattr(m, '__dict__', values)
+        except TypeError as e:
+            raise TypeError(
+                'Model values must be a dict; you may not have returned a dictionary from a root validator'
+            ) from e
+        object_setattr(m, '__fields_set__', fields_set)
+        m._init_private_attributes()
+        return m
 
     @classmethod
     def parse_raw(
@@ -591,9 +704,9 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
         """
         m = cls.__new__(cls)
         fields_values: Dict[str, Any] = {}
-        for name, field in cls.__fields__.items():
-            if field.alt_alias and field.alias in values:
-                fields_values[name] = values[field.alias]
+        for name, alias, field in cls.__construct_fields__:
+            if alias is not None and alias in values:
+                fields_values[name] = values[alias]
             elif name in values:
                 fields_values[name] = values[name]
             elif not field.required:
@@ -609,7 +722,11 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
     def _copy_and_set_values(self: 'Model', values: 'DictStrAny', fields_set: 'SetStr', *, deep: bool) -> 'Model':
         if deep:
             # chances of having empty dict here are quite low for using smart_deepcopy
-            values = deepcopy(values)
+            if all(type(v) in IMMUTABLE_NON_COLLECTIONS_TYPES for v in values.values()):
+                # a deep copy of all-immutable values is indistinguishable from a plain copy
+                values = dict(values)
+            else:
+                values = deepcopy(values)
 
         cls = self.__class__
         m = cls.__new__(cls)
@@ -643,10 +760,14 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
         :return: new model instance
         """
 
-        values = dict(
-            self._iter(to_dict=False, by_alias=False, include=include, exclude=exclude, exclude_unset=False),
-            **(update or {}),
-        )
+        if include is None and exclude is None and self.__include_fields__ is None and self.__exclude_fields__ is None:
+            # no filtering requested: the copied values are exactly the current __dict__
+            values = {**self.__dict__, **update} if update else self.__dict__.copy()
+        else:
+            values = dict(
+                self._iter(to_dict=False, by_alias=False, include=include, exclude=exclude, exclude_unset=False),
+                **(update or {}),
+            )
 
         # new `__fields_set__` can have unset optional fields with a set value in `update` kwarg
         if update:
@@ -658,11 +779,17 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
 
     @classmethod
     def schema(cls, by_alias: bool = True, ref_template: str = default_ref_template) -> 'DictStrAny':
-        cached = cls.__schema_cache__.get((by_alias, ref_template))
+        # reuse a shared key tuple for the default arguments so the overwhelmingly common
+        # `schema()` call doesn't allocate a fresh tuple per cache hit
+        if by_alias is True and ref_template is default_ref_template:
+            key: Tuple[bool, str] = _default_schema_key
+        else:
+            key = by_alias, ref_template
+        cached = cls.__schema_cache__.get(key)
         if cached is not None:
             return cached
         s = model_schema(cls, by_alias=by_alias, ref_template=ref_template)
-        cls.__schema_cache__[(by_alias, ref_template)] = s
+        cls.__schema_cache__[key] = s
         return s
 
     @classmethod
@@ -682,24 +809,14 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
     @classmethod
     def validate(cls: Type['Model'], value: Any) -> 'Model':
         if isinstance(value, cls):
-            copy_on_model_validation = cls.__config__.copy_on_model_validation
-            # whether to deep or shallow copy the model on validation, None means do not copy
-            deep_copy: Optional[bool] = None
-            if copy_on_model_validation not in {'deep', 'shallow', 'none'}:
+            if cls.__copy_on_model_validation_legacy__:
                 # Warn about deprecated behavior
                 warnings.warn(
                     "`copy_on_model_validation` should be a string: 'deep', 'shallow' or 'none'", DeprecationWarning
                 )
-                if copy_on_model_validation:
-                    deep_copy = False
-
-            if copy_on_model_validation == 'shallow':
-                # shallow copy
-                deep_copy = False
-            elif copy_on_model_validation == 'deep':
-                # deep copy
-                deep_copy = True
 
+            # whether to deep or shallow copy the model on validation, None means do not copy
+            deep_copy = cls.__copy_on_model_validation_deep__
             if deep_copy is None:
                 return value
             else:
@@ -738,6 +855,10 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
         exclude_none: bool,
     ) -> Any:
 
+        if type(v) in _SIMPLE_VALUE_TYPES:
+            # exact type check: subclasses (e.g. IntEnum, constrained types) take the generic path
+            return v
+
         if isinstance(v, BaseModel):
             if to_dict:
                 v_dict = v.dict(
@@ -754,6 +875,14 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
             else:
                 return v.copy(include=include, exclude=exclude)
 
+        if include is None and exclude is None:
+            v_type = type(v)
+            if v_type in _SIMPLE_CONTAINER_TYPES and all(type(v_) in _SIMPLE_VALUE_TYPES for v_ in v):
+                # every element is a simple value, so the recursive per-element walk would be a no-op
+                return v_type(v)
+            if v_type is dict and all(type(v_) in _SIMPLE_VALUE_TYPES for v_ in v.values()):
+                return v.copy()
+
         value_exclude = ValueItems(v, exclude) if exclude else None
         value_include = ValueItems(v, include) if include else None
 
@@ -806,6 +935,7 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
         when forward references are not defined.
         """
         update_model_forward_refs(cls, cls.__fields__.values(), cls.__config__.json_encoders, localns, (NameError,))
+        cls._refresh_root_field_shape()
 
     @classmethod
     def update_forward_refs(cls, **localns: Any) -> None:
@@ -813,6 +943,15 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
         Try to update ForwardRefs on fields based on this Model, globalns and localns.
         """
         update_model_forward_refs(cls, cls.__fields__.values(), cls.__config__.json_encoders, localns)
+        cls._refresh_root_field_shape()
+
+    @classmethod
+    def _refresh_root_field_shape(cls) -> None:
+        """
+        Recompute `__root_field_is_mapping__`: resolving forward refs can change the root field's shape.
+        """
+        if cls.__custom_root_type__:
+            cls.__root_field_is_mapping__ = cls.__fields__[ROOT_KEY].shape in MAPPING_LIKE_SHAPES
 
     def __iter__(self) -> 'TupleGenerator':
         """
@@ -820,7 +959,7 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
         """
         yield from self.__dict__.items()
 
-    def _iter(
+    def _iter(  # noqa: C901 (ignore complexity)
         self,
         to_dict: bool = False,
         by_alias: bool = False,
@@ -831,6 +970,40 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
         exclude_none: bool = False,
     ) -> 'TupleGenerator':
 
+        if (
+            include is None
+            and exclude is None
+            and self.__include_fields__ is None
+            and self.__exclude_fields__ is None
+            and not exclude_unset
+            and not exclude_defaults
+        ):
+            # no filtering to do, so skip key calculation and ValueItems machinery entirely
+            if not (to_dict or by_alias or exclude_none):
+                # huge boost for plain _iter()
+                yield from self.__dict__.items()
+                return
+
+            alias_map = self.__alias_map__
+            get_value = self._get_value
+            for field_key, v in self.__dict__.items():
+                if exclude_none and v is None:
+                    continue
+                dict_key = alias_map.get(field_key, field_key) if by_alias else field_key
+                if to_dict:
+                    v = get_value(
+                        v,
+                        to_dict=True,
+                        by_alias=by_alias,
+                        include=None,
+                        exclude=None,
+                        exclude_unset=False,
+                        exclude_defaults=False,
+                        exclude_none=exclude_none,
+                    )
+                yield dict_key, v
+            return
+
         # Merge field set excludes with explicit exclude parameter with explicit overriding field set options.
         # The extra "is not None" guards are not logically necessary but optimizes performance for the simple case.
         if exclude is not None or self.__exclude_fields__ is not None:
@@ -842,11 +1015,15 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
         allowed_keys = self._calculate_keys(
             include=include, exclude=exclude, exclude_unset=exclude_unset  # type: ignore
         )
-        if allowed_keys is None and not (to_dict or by_alias or exclude_unset or exclude_defaults or exclude_none):
-            # huge boost for plain _iter()
-            yield from self.__dict__.items()
-            return
 
+        # flat filters (every value a full include/exclude, e.g. coming from a plain set of field
+        # names) are fully applied through allowed_keys, so the dict export path can skip the
+        # per-element ValueItems tracking; copies still need it so nested models are copied, not shared
+        if to_dict:
+            if exclude is not None and ValueItems.is_flat(exclude):
+                exclude = None
+            if include is not None and ValueItems.is_flat(include):
+                include = None
         value_exclude = ValueItems(self, exclude) if exclude is not None else None
         value_include = ValueItems(self, include) if include is not None else None
 
@@ -859,10 +1036,7 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
                 if not getattr(model_field, 'required', True) and getattr(model_field, 'default', _missing) == v:
                     continue
 
-            if by_alias and field_key in self.__fields__:
-                dict_key = self.__fields__[field_key].alias
-            else:
-                dict_key = field_key
+            dict_key = self.__alias_map__.get(field_key, field_key) if by_alias else field_key
 
             if to_dict or value_include or value_exclude:
                 v = self._get_value(
@@ -889,23 +1063,29 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
 
         keys: AbstractSet[str]
         if exclude_unset:
-            keys = self.__fields_set__.copy()
+            keys = self.__fields_set__
         else:
             keys = self.__dict__.keys()
 
-        if include is not None:
-            keys &= include.keys()
-
-        if update:
-            keys -= update.keys()
-
-        if exclude:
-            keys -= {k for k, v in exclude.items() if ValueItems.is_true(v)}
-
-        return keys
+        # single pass instead of chained set algebra, so at most one set is allocated
+        return {
+            k
+            for k in keys
+            if (include is None or k in include)
+            and not (update and k in update)
+            and not (exclude and ValueItems.is_true(exclude.get(k)))
+        }
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, BaseModel):
+            if (
+                self.__fields__ is other.__fields__
+                and self.__exclude_fields__ is None
+                and self.__include_fields__ is None
+            ):
+                # same model class with no field-level include/exclude: comparing raw field values is
+                # equivalent to comparing the dict() exports but skips the whole serialization walk
+                return self.__dict__ == other.__dict__
             return self.dict() == other.dict()
         else:
             return self.dict() == other
@@ -921,6 +1101,41 @@ class BaseModel(Representation, metaclass=ModelMetaclass):
 _is_base_model_class_defined = True
 
 
+# metaclasses resolved by prepare_class, keyed on the (hashable) bases tuple; only populated
+# when class keywords are absent and __prepare__ produced an empty plain namespace
+_prepare_class_cache: 'LimitedDict[Tuple[Any, ...], type]' = LimitedDict(512)
+
+# shared read-only stand-in for an absent __cls_kwargs__; prepare_class copies its kwds argument
+_EMPTY_CLS_KWARGS: 'DictStrAny' = {}
+
+# the default bases tuple, shared since create_model never mutates it
+_DEFAULT_BASE: Tuple[Type[BaseModel], ...] = (BaseModel,)
+
+# underscore field names already warned about, so regenerating the same model repeatedly
+# doesn't pay the warnings-filter walk each time
+_ignored_field_names_warned: 'SetStr' = set()
+
+_CONFIG_AND_BASE_ERROR = 'to avoid confusion __config__ and __base__ cannot be used together'
+_FIELD_DEFINITION_ERROR = (
+    'field definitions should either be a tuple of (<type>, <default>) or just a '
+    'default value, unfortunately this means tuples as '
+    'default values are not allowed'
+)
+
+
+# merged Config classes keyed by the user-supplied config, so create_model reuses the
+# merge when called repeatedly with the same ``__config__``
+_inherit_config_cache: 'LimitedDict[Type[BaseConfig], Type[BaseConfig]]' = LimitedDict(512)
+
+
+def _inherit_config_cached(config: Type[BaseConfig]) -> Type[BaseConfig]:
+    merged = _inherit_config_cache.get(config)
+    if merged is None:
+        merged = inherit_config(config, BaseConfig)
+        _inherit_config_cache[config] = merged
+    return merged
+
+
 @overload
 def create_model(
     __model_name: str,
@@ -949,7 +1164,7 @@ def create_model(
     ...
 
 
-def create_model(
+def create_model(  # noqa: C901 (ignore complexity)
     __model_name: str,
     *,
     __config__: Optional[Type[BaseConfig]] = None,
@@ -982,51 +1197,81 @@ def create_model(
 
     if __base__ is not None:
         if __config__ is not None:
-            raise ConfigError('to avoid confusion __config__ and __base__ cannot be used together')
-        if not isinstance(__base__, tuple):
-            __base__ = (__base__,)
+            raise ConfigError(_CONFIG_AND_BASE_ERROR)
+        bases: Tuple[Any, ...] = __base__ if isinstance(__base__, tuple) else (__base__,)
     else:
-        __base__ = (cast(Type['Model'], BaseModel),)
+        # the shared default saves a tuple allocation and the runtime cast() it used to need
+        bases = _DEFAULT_BASE
 
-    __cls_kwargs__ = __cls_kwargs__ or {}
+    if __cls_kwargs__ is None:
+        __cls_kwargs__ = _EMPTY_CLS_KWARGS
 
-    fields = {}
-    annotations = {}
-
-    for f_name, f_def in field_definitions.items():
-        if not is_valid_field(f_name):
-            warnings.warn(f'fields may not start with an underscore, ignoring "{f_name}"', RuntimeWarning)
-        if isinstance(f_def, tuple):
-            try:
+    annotations: 'DictStrAny' = {}
+    if __validators__:
+        namespace: 'DictStrAny' = {'__annotations__': annotations, '__module__': __module__, **__validators__}
+    else:
+        namespace = {'__annotations__': annotations, '__module__': __module__}
+
+    if not field_definitions:
+        # zero-field models (plain tool/marker schemas) skip the definition parsing entirely
+        pass
+    elif all(type(f_def) is tuple and len(f_def) == 2 and f_def[0] for f_def in field_definitions.values()) and not any(
+        f_name.startswith('_') for f_name in field_definitions
+    ):
+        # uniform case: every definition is an annotated (<type>, <default>) pair with a plain name,
+        # so both dicts can be filled by branchless comprehensions instead of the per-field loop;
+        # zip over the separate views lets the iterator reuse its pair tuple across steps
+        f_names, f_defs = field_definitions.keys(), field_definitions.values()
+        annotations.update({f_name: f_def[0] for f_name, f_def in zip(f_names, f_defs)})
+        namespace.update({f_name: f_def[1] for f_name, f_def in zip(f_names, f_defs)})
+    else:
+        for f_name, f_def in field_definitions.items():
+            # only names starting with an underscore can be invalid, skip the call for the rest;
+            # warn once per name so regenerated models don't re-emit identical warnings
+            if f_name.startswith('_') and not is_valid_field(f_name) and f_name not in _ignored_field_names_warned:
+                _ignored_field_names_warned.add(f_name)
+                warnings.warn(f'fields may not start with an underscore, ignoring "{f_name}"', RuntimeWarning)
+            # exact type check first: field definitions are normally tuple literals,
+            # isinstance only runs for the rare tuple subclass
+            if type(f_def) is tuple or isinstance(f_def, tuple):
+                if len(f_def) != 2:
+                    raise ConfigError(_FIELD_DEFINITION_ERROR)
                 f_annotation, f_value = f_def
-            except ValueError as e:
-                raise ConfigError(
-                    'field definitions should either be a tuple of (<type>, <default>) or just a '
-                    'default value, unfortunately this means tuples as '
-                    'default values are not allowed'
-                ) from e
-        else:
-            f_annotation, f_value = None, f_def
+            else:
+                f_annotation, f_value = None, f_def
 
-        if f_annotation:
-            annotations[f_name] = f_annotation
-        fields[f_name] = f_value
+            if f_annotation:
+                annotations[f_name] = f_annotation
+            namespace[f_name] = f_value
 
-    namespace: 'DictStrAny' = {'__annotations__': annotations, '__module__': __module__}
-    if __validators__:
-        namespace.update(__validators__)
-    namespace.update(fields)
     if __config__:
-        namespace['Config'] = inherit_config(__config__, BaseConfig)
-    resolved_bases = resolve_bases(__base__)
-    meta, ns, kwds = prepare_class(__model_name, resolved_bases, kwds=__cls_kwargs__)
-    if resolved_bases is not __base__:
-        ns['__orig_bases__'] = __base__
+        namespace['Config'] = _inherit_config_cached(__config__)
+    if all(isinstance(base, type) for base in bases):
+        # PEP 560 __mro_entries__ only applies to non-class entries (e.g. generic aliases),
+        # so plain classes -- the overwhelmingly common case -- need no resolution
+        resolved_bases: Tuple[Any, ...] = bases
+        bases_rewritten = False
+    else:
+        resolved_bases = resolve_bases(bases)
+        bases_rewritten = resolved_bases is not bases
+    meta = None if __cls_kwargs__ else _prepare_class_cache.get(resolved_bases)
+    if meta is not None:
+        # same bases, no class keywords: the resolved metaclass and the empty prepared
+        # namespace are identical to last time, no need to recompute them
+        ns: 'DictStrAny' = {}
+        kwds: 'DictStrAny' = {}
+    else:
+        meta, ns, kwds = prepare_class(__model_name, resolved_bases, kwds=__cls_kwargs__)
+        if not __cls_kwargs__ and not kwds and type(ns) is dict and not ns:
+            _prepare_class_cache[resolved_bases] = meta
+    if bases_rewritten:
+        ns['__orig_bases__'] = bases
     namespace.update(ns)
     return meta(__model_name, resolved_bases, namespace, **kwds)
 
 
 _missing = object()
+_default_schema_key = True, default_ref_template
 
 
 def validate_model(  # noqa: C901 (ignore complexity)
@@ -1040,7 +1285,7 @@ def validate_model(  # noqa: C901 (ignore complexity)
     # input_data names, possibly alias
     names_used = set()
     # field names, never aliases
-    fields_set = set()
+    fields_set: 'SetStr' = set()
     config = model.__config__
     check_extra = config.extra is not Extra.ignore
     cls_ = cls or model
@@ -1051,11 +1296,17 @@ def validate_model(  # noqa: C901 (ignore complexity)
         except (ValueError, TypeError, AssertionError) as exc:
             return {}, set(), ValidationError([ErrorWrapper(exc, loc=ROOT_KEY)], cls_)
 
+    # hoisted loop invariants: attribute and method lookups are not free in CPython
+    input_get = input_data.get
+    fields_set_add = fields_set.add
+    allow_population_by_field_name = config.allow_population_by_field_name
+    validate_all = config.validate_all
+
     for name, field in model.__fields__.items():
-        value = input_data.get(field.alias, _missing)
+        value = input_get(field.alias, _missing)
         using_name = False
-        if value is _missing and config.allow_population_by_field_name and field.alt_alias:
-            value = input_data.get(field.name, _missing)
+        if value is _missing and allow_population_by_field_name and field.alt_alias:
+            value = input_get(field.name, _missing)
             using_name = True
 
         if value is _missing:
@@ -1065,11 +1316,11 @@ def validate_model(  # noqa: C901 (ignore complexity)
 
             value = field.get_default()
 
-            if not config.validate_all and not field.validate_always:
+            if not validate_all and not field.validate_always:
                 values[name] = value
                 continue
         else:
-            fields_set.add(name)
+            fields_set_add(name)
             if check_extra:
                 names_used.add(field.name if using_name else field.alias)
 
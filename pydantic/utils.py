@@ -605,6 +605,15 @@ class ValueItems(Representation):
     def is_true(v: Any) -> bool:
         return v is True or v is ...
 
+    @classmethod
+    def is_flat(cls, items: Union['AbstractSetIntStr', 'MappingIntStrAny']) -> bool:
+        """
+        Check if every value is a full inclusion/exclusion, i.e. there are no element-level specs.
+        """
+        if isinstance(items, AbstractSet):
+            return True
+        return all(cls.is_true(v) for v in items.values())
+
     def __repr_args__(self) -> 'ReprArgs':
         return [(None, self._items)]
 
@@ -683,7 +692,7 @@ def is_valid_field(name: str) -> bool:
     return ROOT_KEY == name
 
 
-DUNDER_ATTRIBUTES = {
+DUNDER_ATTRIBUTES = frozenset({
     '__annotations__',
     '__classcell__',
     '__doc__',
@@ -691,7 +700,7 @@ DUNDER_ATTRIBUTES = {
     '__orig_bases__',
     '__orig_class__',
     '__qualname__',
-}
+})
 
 
 def is_valid_private_name(name: str) -> bool:
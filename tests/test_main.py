@@ -1157,6 +1157,38 @@ def test_dict_with_extra_keys():
     assert m.dict(by_alias=True) == {'alias_a': None, 'extra_key': 'extra'}
 
 
+def test_dict_with_unvalidated_assignment():
+    """Unvalidated assignment can put a nested model on a simple field; dict() must still export it"""
+
+    class Inner(BaseModel):
+        a: int = 1
+
+    class MyModel(BaseModel):
+        x: int
+
+    m = MyModel(x=1)
+    m.x = Inner()
+    assert m.dict() == {'x': {'a': 1}}
+
+
+def test_dict_with_root_validator_injected_container():
+    """A root validator can store a container on a simple field; dict() must copy it, not alias it"""
+
+    class MyModel(BaseModel):
+        x: int
+
+        @root_validator
+        def wrap(cls, values):
+            values['x'] = [values['x']]
+            return values
+
+    m = MyModel(x=1)
+    d = m.dict()
+    assert d == {'x': [1]}
+    d['x'].append(2)
+    assert m.x == [1]
+
+
 def test_root():
     class MyModel(BaseModel):
         __root__: str